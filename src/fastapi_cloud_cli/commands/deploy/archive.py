@@ -48,8 +48,8 @@ def _get_app_name(path: Path) -> str:
     return path.name
 
 
-def _should_exclude_entry(path: Path) -> bool:
-    parts_to_exclude = [
+_PARTS_TO_EXCLUDE = frozenset(
+    {
         ".venv",
         "__pycache__",
         ".mypy_cache",
@@ -57,9 +57,12 @@ def _should_exclude_entry(path: Path) -> bool:
         ".git",
         ".gitignore",
         ".fastapicloudignore",
-    ]
+    }
+)
+
 
-    if any(part in path.parts for part in parts_to_exclude):
+def _should_exclude_entry(path: Path) -> bool:
+    if not _PARTS_TO_EXCLUDE.isdisjoint(path.parts):
         return True
 
     if path.suffix == ".pyc":
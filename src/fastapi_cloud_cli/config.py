@@ -1,12 +1,15 @@
+import functools
 import json
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .utils.config import get_cli_config_path
 
 
 class Settings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     base_api_url: str = "https://api.fastapicloud.com/api/v1"
     dashboard_base_url: str = "https://dashboard.fastapicloud.com"
     client_id: str = "fastapi-cli"
@@ -14,14 +17,20 @@ class Settings(BaseModel):
     @classmethod
     def from_user_settings(cls, config_path: Path) -> "Settings":
         try:
-            content = config_path.read_bytes() if config_path.exists() else b"{}"
-
-            user_settings = json.loads(content)
-        except json.JSONDecodeError:
+            user_settings = json.loads(config_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError):
             user_settings = {}
 
         return cls(**user_settings)
 
     @classmethod
     def get(cls) -> "Settings":
-        return cls.from_user_settings(get_cli_config_path())
+        return _load_settings(get_cli_config_path())
+
+
+@functools.cache
+def _load_settings(config_path: Path) -> Settings:
+    # Cached per cli.json path: a different config folder (e.g. through
+    # FASTAPI_CLOUD_CLI_CONFIG_DIR) loads its own settings, while edits to an
+    # already loaded file are only picked up by a new process
+    return Settings.from_user_settings(config_path)
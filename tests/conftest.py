@@ -4,15 +4,23 @@ import tempfile
 from collections.abc import Generator
 from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 import respx
 from typer import rich_utils
+from typer.testing import CliRunner
 
+from fastapi_cloud_cli.cli import app
 from fastapi_cloud_cli.config import Settings
 
 from .utils import create_jwt_token
 
+# The auth file contents never change, the file itself is still written per test
+# since every test gets its own config folder
+_VALID_TOKEN = create_jwt_token({"sub": "test_user_12345"})
+_LOGGED_IN_AUTH_CONFIG = f'{{"access_token": "{_VALID_TOKEN}"}}'
+
 
 @pytest.fixture(autouse=True)
 def unset_env_vars(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
@@ -54,22 +62,29 @@ def setup_terminal() -> None:
     return
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="session")
+def warm_up_cli() -> None:
+    # The first invocation pays for one-off initialization in Typer, Click and
+    # Rich, run it once here so it isn't attributed to whichever test runs first
+    CliRunner().invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="session")
 def settings() -> Settings:
-    return Settings.get()
+    # Tests never write a cli.json to the isolated config folder, so the user
+    # settings are always the defaults
+    return Settings()
 
 
 @pytest.fixture
 def respx_mock(settings: Settings) -> Generator[respx.MockRouter, None, None]:
-    with respx.mock(base_url=settings.base_api_url) as mock_router:
+    with respx.mock(base_url=settings.base_api_url, using="httpx") as mock_router:
         yield mock_router
 
 
 @pytest.fixture
 def logged_in_cli(temp_auth_config: Path) -> Generator[None, None, None]:
-    valid_token = create_jwt_token({"sub": "test_user_12345"})
-
-    temp_auth_config.write_text(f'{{"access_token": "{valid_token}"}}')
+    temp_auth_config.write_text(_LOGGED_IN_AUTH_CONFIG)
 
     yield
 
@@ -99,3 +114,11 @@ def configured_app(tmp_path: Path) -> ConfiguredApp:
     config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
 
     return ConfiguredApp(app_id=app_id, team_id=team_id, path=tmp_path)
+
+
+@pytest.fixture
+def mock_getchar(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    mock = MagicMock()
+    monkeypatch.setattr("rich_toolkit.container.getchar", mock)
+
+    return mock
@@ -2,10 +2,10 @@ import itertools
 import json
 import random
 import re
-import string
+from collections.abc import Callable
 from pathlib import Path
-from typing import TypedDict
-from unittest.mock import call, patch
+from typing import Any, NoReturn, TypedDict
+from unittest.mock import MagicMock, call, patch
 
 import httpx
 import pytest
@@ -26,11 +26,47 @@ runner = CliRunner()
 
 assets_path = Path(__file__).parent / "assets"
 
+# Select the team, create a new app named "demo" and confirm the deployment
+_CREATE_DEMO_APP_STEPS = (
+    Keys.ENTER,
+    Keys.ENTER,
+    *"demo",
+    Keys.ENTER,
+    Keys.ENTER,
+    Keys.ENTER,
+)
+
+# Build log streams shared by most deployment tests, serialized once
+_BUILD_LOGS_OK = build_logs_response(
+    {"type": "message", "message": "Building...", "id": "1"},
+    {"type": "complete"},
+)
+_BUILD_LOGS_COMPLETE = build_logs_response({"type": "complete"})
+_BUILD_LOGS_ALL_GOOD = build_logs_response(
+    {"type": "message", "message": "Building...", "id": "1"},
+    {"type": "message", "message": "All good!", "id": "2"},
+    {"type": "complete"},
+)
+
+# respx clones the response for every matched request, so one instance can be shared
+_UPLOAD_URL_RESPONSE = Response(
+    200, json={"url": "http://test.com", "fields": {"key": "value"}}
+)
+_OK_RESPONSE = Response(200)
+
+_EXPIRED_TOKEN = create_jwt_token({"sub": "test_user", "exp": 0})
+_EXPIRED_TOKEN_CONFIG = f'{{"access_token": "{_EXPIRED_TOKEN}"}}'
+
+
+# Only uniqueness matters for the generated names and IDs, so a counter is enough
+_counter = itertools.count()
+
 
 def _get_random_team(name: str | None = None) -> dict[str, str]:
-    name = name or "".join(random.choices(string.ascii_lowercase, k=10))
-    slug = "".join(random.choices(string.ascii_lowercase, k=10))
-    id = "".join(random.choices(string.digits, k=10))
+    n = next(_counter)
+    name = name or f"team{n:010d}"
+    slug = f"team-slug{n:010d}"
+    id = str(10**9 + n)
 
     return {"name": name, "slug": slug, "id": id}
 
@@ -49,10 +85,11 @@ def _get_random_app(
     team_id: str | None = None,
     directory: str | None = None,
 ) -> RandomApp:
-    name = "".join(random.choices(string.ascii_lowercase, k=10))
-    slug = slug or "".join(random.choices(string.ascii_lowercase, k=10))
-    id = "".join(random.choices(string.digits, k=10))
-    team_id = team_id or "".join(random.choices(string.digits, k=10))
+    n = next(_counter)
+    name = f"app{n:010d}"
+    slug = slug or f"app-slug{n:010d}"
+    id = str(10**9 + n)
+    team_id = team_id or str(2 * 10**9 + n)
 
     return {
         "name": name,
@@ -68,9 +105,10 @@ def _get_random_deployment(
     app_id: str | None = None,
     status: str = "waiting_upload",
 ) -> dict[str, str]:
-    id = "".join(random.choices(string.digits, k=10))
-    slug = "".join(random.choices(string.ascii_lowercase, k=10))
-    app_id = app_id or "".join(random.choices(string.digits, k=10))
+    n = next(_counter)
+    id = str(10**9 + n)
+    slug = f"deployment-slug{n:010d}"
+    app_id = app_id or str(2 * 10**9 + n)
 
     return {
         "id": id,
@@ -82,12 +120,74 @@ def _get_random_deployment(
     }
 
 
+def _raising(exc: BaseException) -> Callable[..., NoReturn]:
+    def raise_exc(*args: Any, **kwargs: Any) -> NoReturn:
+        raise exc
+
+    return raise_exc
+
+
+def _write_app_config(path: Path, app_id: str, team_id: str) -> None:
+    config_dir = path / ".fastapicloud"
+    config_dir.mkdir(exist_ok=True)
+    (config_dir / "cloud.json").write_text(
+        f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}'
+    )
+
+
+def _mock_apps_list(
+    respx_mock: respx.MockRouter, team_apps: dict[str, list[RandomApp]]
+) -> None:
+    def apps_handler(request: httpx.Request) -> Response:
+        # Raises KeyError for a missing or unexpected team_id, which fails the test
+        # just like a route that doesn't match
+        apps = team_apps[request.url.params["team_id"]]
+
+        return Response(200, json={"data": apps})
+
+    respx_mock.get("/apps/").mock(side_effect=apps_handler)
+
+
+def _mock_upload_pipeline(
+    respx_mock: respx.MockRouter,
+    deployment_data: dict[str, str],
+    *,
+    build_logs: str | None = _BUILD_LOGS_OK,
+) -> None:
+    """Mock the upload, upload-complete and (optionally) build logs requests."""
+    deployment_id = deployment_data["id"]
+
+    respx_mock.post(f"/deployments/{deployment_id}/upload").mock(
+        return_value=_UPLOAD_URL_RESPONSE
+    )
+    respx_mock.post("http://test.com", data={"key": "value"}).mock(
+        return_value=_OK_RESPONSE
+    )
+    respx_mock.post(f"/deployments/{deployment_id}/upload-complete").mock(
+        return_value=Response(
+            200, json={**deployment_data, "status": "ready_for_build"}
+        )
+    )
+
+    if build_logs is not None:
+        respx_mock.get(f"/deployments/{deployment_id}/build-logs").mock(
+            return_value=Response(200, content=build_logs)
+        )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Retries and polling sleep between attempts, none of that should slow tests down
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
 @pytest.mark.respx
 def test_starts_login_when_not_logged_in(
     logged_out_cli: None,
     tmp_path: Path,
     respx_mock: respx.MockRouter,
     settings: Settings,
+    mock_getchar: MagicMock,
 ) -> None:
     respx_mock.post(
         "/login/device/authorization", data={"client_id": settings.client_id}
@@ -112,14 +212,10 @@ def test_starts_login_when_not_logged_in(
     ).mock(return_value=Response(200, json={"access_token": "test_token_1234"}))
     respx_mock.get("/teams/").mock(return_value=Response(500))
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-        patch("fastapi_cloud_cli.commands.login.typer.launch") as mock_launch,
-    ):
+    with patch("fastapi_cloud_cli.commands.login.typer.launch") as mock_launch:
         mock_getchar.side_effect = [Keys.ENTER]
 
-        result = runner.invoke(app, ["deploy"])
+        result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert "Welcome to FastAPI Cloud!" in result.output
     assert "You need to be logged in to deploy to FastAPI Cloud." in result.output
@@ -130,17 +226,13 @@ def test_starts_login_when_not_logged_in(
 
 
 def test_cancels_deploy_when_user_declines_login(
-    logged_out_cli: None, tmp_path: Path
+    logged_out_cli: None, tmp_path: Path, mock_getchar: MagicMock
 ) -> None:
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-        patch(
-            "fastapi_cloud_cli.commands.deploy.command._interactive_login"
-        ) as mock_login,
-    ):
+    with patch(
+        "fastapi_cloud_cli.commands.deploy.command._interactive_login"
+    ) as mock_login:
         mock_getchar.side_effect = [Keys.RIGHT_ARROW, Keys.ENTER]
-        result = runner.invoke(app, ["deploy"])
+        result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 0
     assert "Welcome to FastAPI Cloud!" in result.output
@@ -152,21 +244,16 @@ def test_cancels_deploy_when_user_declines_login(
 
 
 def test_shows_login_prompt_when_token_is_expired(
-    temp_auth_config: Path, tmp_path: Path
+    temp_auth_config: Path, tmp_path: Path, mock_getchar: MagicMock
 ) -> None:
-    expired_token = create_jwt_token({"sub": "test_user", "exp": 0})
-    temp_auth_config.write_text(f'{{"access_token": "{expired_token}"}}')
+    temp_auth_config.write_text(_EXPIRED_TOKEN_CONFIG)
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-        patch(
-            "fastapi_cloud_cli.commands.deploy.command._interactive_login"
-        ) as mock_login,
-    ):
+    with patch(
+        "fastapi_cloud_cli.commands.deploy.command._interactive_login"
+    ) as mock_login:
         mock_getchar.side_effect = [Keys.ENTER]
         mock_login.side_effect = typer.Exit(0)
-        result = runner.invoke(app, ["deploy"])
+        result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert "Welcome to FastAPI Cloud!" in result.output
     assert "Your session has expired. Please log in again." in result.output
@@ -177,8 +264,7 @@ def test_shows_login_prompt_when_token_is_expired(
 def test_fails_with_clear_error_when_running_on_ci_without_token(
     logged_out_cli: None, tmp_path: Path
 ) -> None:
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"], env={"CI": "true"})
+    result = runner.invoke(app, ["deploy", str(tmp_path)], env={"CI": "true"})
 
     assert result.exit_code == 1
     assert result.exception is not None
@@ -197,29 +283,23 @@ def test_deploy_json_uses_configured_app_and_skips_waiting_by_default(
     deployment_data = _get_random_deployment(app_id=app_id)
     uploaded_deployment_data = {**deployment_data, "status": "ready_for_build"}
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
     respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
+        return_value=_UPLOAD_URL_RESPONSE
     )
     respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
+        return_value=_OK_RESPONSE
     )
     respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
         return_value=Response(200, json=uploaded_deployment_data)
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--json"])
 
     assert result.exit_code == 0
     assert json.loads(result.stdout) == {
@@ -241,8 +321,7 @@ def test_deploy_json_uses_configured_app_and_skips_waiting_by_default(
 def test_deploy_json_returns_missing_required_input_without_app_context(
     logged_in_cli: None, tmp_path: Path
 ) -> None:
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--json"])
 
     assert result.exit_code == 1
     assert json.loads(result.stdout) == {
@@ -257,8 +336,7 @@ def test_deploy_json_returns_missing_required_input_without_app_context(
 def test_deploy_json_returns_not_logged_in_without_prompt(
     logged_out_cli: None, tmp_path: Path
 ) -> None:
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--json"])
 
     assert result.exit_code == 1
     assert json.loads(result.stdout) == {
@@ -282,32 +360,16 @@ def test_deploy_json_includes_large_file_warnings(
         status="ready_for_build",
     )
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
     _create_file(tmp_path / "model.bin", 12 * 1024 * 1024)
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data, build_logs=None)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--json"])
 
     assert result.exit_code == 0
     assert json.loads(result.stdout)["warnings"] == [
@@ -321,49 +383,50 @@ def test_deploy_json_includes_large_file_warnings(
 
 @pytest.mark.respx
 def test_shows_error_when_trying_to_get_teams(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER]
 
     respx_mock.get("/teams/").mock(return_value=Response(500))
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "Error fetching teams. Please try again later" in result.output
+    assert "Error fetching teams. Please try again later" in result.output
 
 
 @pytest.mark.respx
 def test_handles_invalid_auth(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER]
 
     respx_mock.get("/teams/").mock(return_value=Response(401))
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "The specified token is not valid" in result.output
+    assert "The specified token is not valid" in result.output
 
 
 @pytest.mark.respx
 def test_shows_teams(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER, Keys.CTRL_C]
 
@@ -377,23 +440,22 @@ def test_shows_teams(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert team_1["name"] in result.output
-        assert team_2["name"] in result.output
+    assert team_1["name"] in result.output
+    assert team_2["name"] in result.output
 
 
 @pytest.mark.respx
 def test_filter_teams(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [*"al", Keys.ENTER, Keys.CTRL_C]
 
@@ -407,29 +469,28 @@ def test_filter_teams(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "Filter: al" in result.output
+    assert "Filter: al" in result.output
 
-        # Truncate part of the output before "Filter: al"
-        filer_pos = result.output.rfind("Filter: al")
-        last_output = result.output[filer_pos:]
+    # Truncate part of the output before "Filter: al"
+    filer_pos = result.output.rfind("Filter: al")
+    last_output = result.output[filer_pos:]
 
-        assert team_1["name"] in last_output
-        assert team_2["name"] not in last_output
+    assert team_1["name"] in last_output
+    assert team_2["name"] not in last_output
 
 
 @pytest.mark.respx
 def test_asks_for_app_name_after_team(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER, Keys.ENTER, Keys.ENTER, Keys.CTRL_C]
 
@@ -440,22 +501,21 @@ def test_asks_for_app_name_after_team(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "What's your app name?" in result.output
+    assert "What's your app name?" in result.output
 
 
 @pytest.mark.respx
 def test_filter_apps(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER, Keys.RIGHT_ARROW, Keys.ENTER, *"an", Keys.ENTER, Keys.CTRL_C]
 
@@ -471,36 +531,31 @@ def test_filter_apps(
     app_1 = _get_random_app(team_id=team["id"], slug="My App")
     app_2 = _get_random_app(team_id=team["id"], slug="Another App")
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_1, app_2]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_1, app_2]})
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "Filter: an" in result.output
+    assert "Filter: an" in result.output
 
-        # Truncate part of the output before "Filter: an"
-        filer_pos = result.output.rfind("Filter: an")
-        last_output = result.output[filer_pos:]
+    # Truncate part of the output before "Filter: an"
+    filer_pos = result.output.rfind("Filter: an")
+    last_output = result.output[filer_pos:]
 
-        assert app_1["slug"] not in last_output
-        assert app_2["slug"] in last_output
+    assert app_1["slug"] not in last_output
+    assert app_2["slug"] in last_output
 
 
 @pytest.mark.respx
 def test_creates_app_on_backend(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
-    steps = [Keys.ENTER, Keys.ENTER, *"demo", Keys.ENTER, Keys.ENTER, Keys.ENTER]
-
     team = _get_random_team()
 
     respx_mock.get("/teams/").mock(
@@ -514,24 +569,22 @@ def test_creates_app_on_backend(
         "/apps/", json={"name": "demo", "team_id": team["id"], "directory": None}
     ).mock(return_value=Response(201, json=_get_random_app(team_id=team["id"])))
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = _CREATE_DEMO_APP_STEPS
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "App created successfully" in result.output
+    assert "App created successfully" in result.output
 
 
 @pytest.mark.respx
 def test_shows_api_message_when_create_app_is_forbidden(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
-    steps = [Keys.ENTER, Keys.ENTER, *"demo", Keys.ENTER, Keys.ENTER, Keys.ENTER]
     team = _get_random_team()
 
     respx_mock.get("/teams/").mock(return_value=Response(200, json={"data": [team]}))
@@ -544,13 +597,9 @@ def test_shows_api_message_when_create_app_is_forbidden(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = _CREATE_DEMO_APP_STEPS
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 1
     assert "App limit reached" in result.output
@@ -558,7 +607,10 @@ def test_shows_api_message_when_create_app_is_forbidden(
 
 @pytest.mark.respx
 def test_creates_app_with_directory(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,
@@ -583,48 +635,45 @@ def test_creates_app_with_directory(
         "/apps/", json={"name": "demo", "team_id": team["id"], "directory": "src"}
     ).mock(return_value=Response(201, json=_get_random_app(team_id=team["id"])))
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "App created successfully" in result.output
-        assert "Directory where your app's pyproject.toml file lives" in result.output
-        assert "Directory: src" in result.output
+    assert "App created successfully" in result.output
+    assert "Directory where your app's pyproject.toml file lives" in result.output
+    assert "Directory: src" in result.output
 
 
-@pytest.mark.respx
-@pytest.mark.parametrize(
-    "directory,expected_error",
-    [
-        ("~/src", "cannot start with '~'"),
-        ("/absolute/path", "must be a relative path, not absolute"),
-        ("src/../etc", "cannot contain '..' path segments"),
-        ("src/@app", "contains invalid characters"),
-    ],
+_INVALID_DIRECTORIES = (
+    ("~/src", "cannot start with '~'"),
+    ("/absolute/path", "must be a relative path, not absolute"),
+    ("src/../etc", "cannot contain '..' path segments"),
+    ("src/@app", "contains invalid characters"),
 )
+
+
+@pytest.mark.respx
 def test_shows_validation_error_for_invalid_directory(
     logged_in_cli: None,
     tmp_path: Path,
     respx_mock: respx.MockRouter,
-    directory: str,
-    expected_error: str,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
         Keys.ENTER,  # Confirm new app
         *"demo",
         Keys.ENTER,  # App name
-        *directory,
-        Keys.ENTER,  # Submit invalid directory -> validation error shown
-        Keys.CTRL_C,  # Cancel
     ]
 
+    # Submit each invalid directory, then clear the input before the next one
+    for directory, _ in _INVALID_DIRECTORIES:
+        steps += [*directory, Keys.ENTER, *Keys.BACKSPACE * len(directory)]
+
+    steps.append(Keys.CTRL_C)  # Cancel
+
     respx_mock.get("/teams/").mock(
         return_value=Response(
             200,
@@ -632,20 +681,20 @@ def test_shows_validation_error_for_invalid_directory(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
+    for _, expected_error in _INVALID_DIRECTORIES:
         assert expected_error in result.output
 
 
 @pytest.mark.respx
 def test_cancels_deployment_when_user_selects_no(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,
@@ -666,21 +715,20 @@ def test_cancels_deployment_when_user_selects_no(
         )
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert "Deployment cancelled." in result.output
+    assert result.exit_code == 0
+    assert "Deployment cancelled." in result.output
 
 
 @pytest.mark.respx
 def test_uses_existing_app(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [Keys.ENTER, Keys.RIGHT_ARROW, Keys.ENTER, *"demo", Keys.ENTER]
 
@@ -690,27 +738,24 @@ def test_uses_existing_app(
 
     app_data = _get_random_app(team_id=team["id"])
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_data]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_data]})
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "Select the app you want to deploy to:" in result.output
-        assert app_data["slug"] in result.output
+    assert "Select the app you want to deploy to:" in result.output
+    assert app_data["slug"] in result.output
 
 
 @pytest.mark.respx
 def test_uses_existing_app_with_directory(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
@@ -728,24 +773,21 @@ def test_uses_existing_app_with_directory(
 
     app_data = _get_random_app(team_id=team["id"], directory="backend")
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_data]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_data]})
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert "Directory: backend" in result.output
+    assert "Directory: backend" in result.output
 
 
 @pytest.mark.respx
 def test_uses_existing_app_and_changes_directory(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
@@ -765,24 +807,22 @@ def test_uses_existing_app_and_changes_directory(
 
     app_data = _get_random_app(team_id=team["id"], directory="backend")
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_data]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_data]})
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert "Directory: src" in result.output
+    assert "Directory: src" in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_updates_app_directory_via_api_when_changed(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
@@ -801,9 +841,7 @@ def test_updates_app_directory_via_api_when_changed(
 
     app_data = _get_random_app(team_id=team["id"], directory="backend")
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_data]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_data]})
 
     updated_app_data = {**app_data, "directory": "src"}
 
@@ -820,50 +858,28 @@ def test_updates_app_directory_via_api_when_changed(
     respx_mock.post(f"/apps/{app_data['id']}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data)
 
     respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert patch_route.called
-        assert "App directory updated" in result.output
+    assert result.exit_code == 0
+    assert patch_route.called
+    assert "App directory updated" in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_does_not_update_app_directory_when_unchanged(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
@@ -880,9 +896,7 @@ def test_does_not_update_app_directory_when_unchanged(
 
     app_data = _get_random_app(team_id=team["id"], directory="backend")
 
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": [app_data]})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: [app_data]})
 
     respx_mock.get(f"/apps/{app_data['id']}").mock(
         return_value=Response(200, json=app_data)
@@ -893,59 +907,28 @@ def test_does_not_update_app_directory_when_unchanged(
     respx_mock.post(f"/apps/{app_data['id']}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data)
 
     respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert "App directory updated" not in result.output
+    assert result.exit_code == 0
+    assert "App directory updated" not in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_exits_successfully_when_deployment_is_done(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
-    steps = [
-        Keys.ENTER,
-        Keys.ENTER,
-        *"demo",
-        Keys.ENTER,
-        Keys.ENTER,
-        Keys.ENTER,
-    ]
-
     team_data = _get_random_team()
     app_data = _get_random_app(team_id=team_data["id"])
 
@@ -966,230 +949,83 @@ def test_exits_successfully_when_deployment_is_done(
     respx_mock.post(f"/apps/{app_data['id']}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={
-                "url": "http://test.com",
-                "fields": {"key": "value"},
-            },
-        )
-    )
-
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload-complete",
-    ).mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    respx_mock.post(
-        "http://test.com",
-        data={"key": "value"},
-    ).mock(return_value=Response(200))
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data)
 
     respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = _CREATE_DEMO_APP_STEPS
 
+    # Most users run deploy without a path, keep covering the current directory default
+    with changing_dir(tmp_path):
         result = runner.invoke(app, ["deploy"])
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
+    assert (tmp_path / ".fastapicloud" / "cloud.json").exists()
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_exits_successfully_when_deployment_is_done_when_app_is_configured(
     logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "message", "message": "All good!", "id": "2"},
-                {"type": "complete"},
-            ),
-        )
-    )
-
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload-complete",
-    ).mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+    _setup_deployment_mocks(
+        respx_mock,
+        app_data,
+        team_id,
+        deployment_data,
+        tmp_path,
+        build_logs=_BUILD_LOGS_ALL_GOOD,
     )
 
     respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
+    # Reads .fastapicloud/cloud.json from the current directory, as with a bare deploy
     with changing_dir(tmp_path):
         result = runner.invoke(app, ["deploy"])
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
 
-        # check that logs are shown
-        assert "All good!" in result.output
+    # check that logs are shown
+    assert "All good!" in result.output
 
-        # check that the app URL is shown
-        assert deployment_data["url"] in result.output
+    # check that the app URL is shown
+    assert deployment_data["url"] in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_exits_with_error_when_deployment_fails_to_build(
     logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
-    app_id = app_data["id"]
-    team_id = team_data["id"]
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            json={"type": "failed"},
-        )
-    )
-
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload-complete",
-    ).mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
-
-        assert result.exit_code == 1
-
-        assert "Oh no! Something went wrong" in result.output
-        assert deployment_data["dashboard_url"] in result.output
-
-
-@pytest.mark.respx
-def test_shows_error_when_deployment_build_fails(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
-) -> None:
-    app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            json={"type": "failed"},
-        )
-    )
-
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload-complete",
-    ).mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+    _setup_deployment_mocks(
+        respx_mock,
+        app_data,
+        team_id,
+        deployment_data,
+        tmp_path,
+        build_logs=build_logs_response({"type": "failed"}),
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert "Something went wrong" in result.stdout
+    assert result.exit_code == 1
 
-        assert result.exit_code == 1
+    assert "Oh no! Something went wrong" in result.output
+    assert deployment_data["dashboard_url"] in result.output
 
 
 @pytest.mark.respx
@@ -1198,24 +1034,16 @@ def test_shows_error_when_app_does_not_exist(
 ) -> None:
     respx_mock.get(f"/apps/{configured_app.app_id}").mock(return_value=Response(404))
 
-    with changing_dir(configured_app.path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(configured_app.path)])
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert "App not found" in result.output
+    assert "App not found" in result.output
 
 
-def _deploy_without_waiting(respx_mock: respx.MockRouter, tmp_path: Path) -> Result:
-    steps = [
-        Keys.ENTER,
-        Keys.ENTER,
-        *"demo",
-        Keys.ENTER,
-        Keys.ENTER,
-        Keys.ENTER,
-    ]
-
+def _deploy_without_waiting(
+    respx_mock: respx.MockRouter, tmp_path: Path, mock_getchar: MagicMock
+) -> Result:
     team_data = _get_random_team()
     app_data = _get_random_app(team_id=team_data["id"])
     deployment_data = _get_random_deployment(app_id=app_data["id"])
@@ -1238,44 +1066,21 @@ def _deploy_without_waiting(respx_mock: respx.MockRouter, tmp_path: Path) -> Res
     respx_mock.post(f"/apps/{app_data['id']}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload",
-    ).mock(
-        return_value=Response(
-            200,
-            json={
-                "url": "http://test.com",
-                "fields": {"key": "value"},
-            },
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data, build_logs=None)
 
-    respx_mock.post(
-        f"/deployments/{deployment_data['id']}/upload-complete",
-    ).mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = _CREATE_DEMO_APP_STEPS
 
-        return runner.invoke(app, ["deploy", "--no-wait"])
+    return runner.invoke(app, ["deploy", str(tmp_path), "--no-wait"])
 
 
 @pytest.mark.respx
 def test_can_skip_waiting(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
-    result = _deploy_without_waiting(respx_mock, tmp_path)
+    result = _deploy_without_waiting(respx_mock, tmp_path, mock_getchar)
 
     assert result.exit_code == 0
 
@@ -1284,9 +1089,12 @@ def test_can_skip_waiting(
 
 @pytest.mark.respx
 def test_creates_config_folder_and_creates_git_ignore(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
-    _deploy_without_waiting(respx_mock, tmp_path)
+    _deploy_without_waiting(respx_mock, tmp_path, mock_getchar)
 
     assert (tmp_path / ".fastapicloud" / "cloud.json").exists()
     assert (tmp_path / ".fastapicloud" / "README.md").exists()
@@ -1295,19 +1103,25 @@ def test_creates_config_folder_and_creates_git_ignore(
 
 @pytest.mark.respx
 def test_does_not_duplicate_entry_in_git_ignore(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     git_ignore_path = tmp_path / ".gitignore"
     git_ignore_path.write_text(".fastapicloud\n")
 
-    _deploy_without_waiting(respx_mock, tmp_path)
+    _deploy_without_waiting(respx_mock, tmp_path, mock_getchar)
 
     assert git_ignore_path.read_text() == ".fastapicloud\n"
 
 
 @pytest.mark.respx
 def test_shows_no_apps_found_message_when_team_has_no_apps(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    mock_getchar: MagicMock,
 ) -> None:
     steps = [
         Keys.ENTER,  # Select team
@@ -1320,23 +1134,16 @@ def test_shows_no_apps_found_message_when_team_has_no_apps(
     respx_mock.get("/teams/").mock(return_value=Response(200, json={"data": [team]}))
 
     # Mock empty apps list for the team
-    respx_mock.get("/apps/", params={"team_id": team["id"]}).mock(
-        return_value=Response(200, json={"data": []})
-    )
+    _mock_apps_list(respx_mock, {team["id"]: []})
 
-    with (
-        changing_dir(tmp_path),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = steps
+    mock_getchar.side_effect = steps
 
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
-        assert (
-            "No apps found in this team. You can create a new app instead."
-            in result.output
-        )
+    assert result.exit_code == 1
+    assert (
+        "No apps found in this team. You can create a new app instead." in result.output
+    )
 
 
 @pytest.mark.parametrize(
@@ -1345,210 +1152,80 @@ def test_shows_no_apps_found_message_when_team_has_no_apps(
 )
 @pytest.mark.respx
 def test_shows_error_message_on_build_exception(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter, error: Exception
-) -> None:
-    app_data = _get_random_app()
-    team_data = _get_random_team()
-    app_id = app_data["id"]
-    team_id = team_data["id"]
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.utils.api.APIClient.stream_build_logs",
-            side_effect=error,
-        ),
-    ):
-        result = runner.invoke(app, ["deploy"])
-
-        assert result.exit_code == 1
-        assert "Unable to stream build logs" in result.output
-        assert deployment_data["dashboard_url"] in result.output
-
-
-@pytest.mark.respx
-def test_shows_error_message_on_build_log_http_error(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    error: Exception,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+    _setup_deployment_mocks(
+        respx_mock, app_data, team_id, deployment_data, tmp_path, build_logs=None
     )
 
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(500, text="Internal Server Error")
+    monkeypatch.setattr(
+        "fastapi_cloud_cli.utils.api.APIClient.stream_build_logs", _raising(error)
     )
 
-    with changing_dir(tmp_path), patch("time.sleep"):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
-        assert "Unable to stream build logs" in result.output
-        assert deployment_data["dashboard_url"] in result.output
+    assert result.exit_code == 1
+    assert "Unable to stream build logs" in result.output
+    assert deployment_data["dashboard_url"] in result.output
 
 
 @pytest.mark.respx
-def test_short_wait_messages(
-    logged_in_cli: None,
-    tmp_path: Path,
-    respx_mock: respx.MockRouter,
+@pytest.mark.deploy_flow
+def test_shows_error_message_on_build_log_http_error(
+    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+    _setup_deployment_mocks(
+        respx_mock, app_data, team_id, deployment_data, tmp_path, build_logs=None
     )
 
-    # Each build-log request advances the fake monotonic clock so the elapsed
-    # time determines which message pool is used.
-    clock = [0.0]
-
-    def build_logs_handler(request: httpx.Request, route: respx.Route) -> Response:
-        if route.call_count <= 2:
-            clock[0] += 3
-            return Response(
-                200,
-                content=build_logs_response(
-                    {
-                        "type": "message",
-                        "message": f"Step {route.call_count}",
-                        "id": str(route.call_count),
-                    },
-                    {"type": "timeout"},
-                ),
-            )
-        else:
-            return Response(
-                200,
-                content=build_logs_response(
-                    {"type": "complete"},
-                ),
-            )
-
     respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        side_effect=build_logs_handler
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+        return_value=Response(500, text="Internal Server Error")
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch("time.sleep"),
-        patch("time.monotonic", side_effect=lambda: clock[0]),
-        patch.object(wait, "cycle", wraps=itertools.cycle) as cycle_spy,
-    ):
-        result = runner.invoke(app, ["deploy"])
-
-        assert result.exit_code == 0
-        assert "Ready the chicken!" in result.output
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        # This is a short wait, so LONG_WAIT_MESSAGES should not be accessed by the
-        # `cycle` function.
-        assert call(wait.LONG_WAIT_MESSAGES) not in cycle_spy.call_args_list
+    assert result.exit_code == 1
+    assert "Unable to stream build logs" in result.output
+    assert deployment_data["dashboard_url"] in result.output
 
 
 @pytest.mark.respx
-def test_long_wait_messages(
+@pytest.mark.deploy_flow
+@pytest.mark.parametrize(
+    "step_seconds,is_long_wait",
+    [
+        pytest.param(3, False, id="short"),
+        pytest.param(35, True, id="long"),
+    ],
+)
+def test_wait_messages(
     logged_in_cli: None,
     tmp_path: Path,
     respx_mock: respx.MockRouter,
+    step_seconds: int,
+    is_long_wait: bool,
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+    _setup_deployment_mocks(
+        respx_mock, app_data, team_id, deployment_data, tmp_path, build_logs=None
     )
 
     # Each build-log request advances the fake monotonic clock so the elapsed
@@ -1557,7 +1234,7 @@ def test_long_wait_messages(
 
     def build_logs_handler(request: httpx.Request, route: respx.Route) -> Response:
         if route.call_count <= 2:
-            clock[0] += 35
+            clock[0] += step_seconds
             return Response(
                 200,
                 content=build_logs_response(
@@ -1570,12 +1247,7 @@ def test_long_wait_messages(
                 ),
             )
         else:
-            return Response(
-                200,
-                content=build_logs_response(
-                    {"type": "complete"},
-                ),
-            )
+            return Response(200, content=_BUILD_LOGS_COMPLETE)
 
     respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
         side_effect=build_logs_handler
@@ -1586,34 +1258,35 @@ def test_long_wait_messages(
     )
 
     with (
-        changing_dir(tmp_path),
-        patch("time.sleep"),
         patch("time.monotonic", side_effect=lambda: clock[0]),
         patch.object(wait, "cycle", wraps=itertools.cycle) as cycle_spy,
     ):
-        result = runner.invoke(app, ["deploy"])
+        result = runner.invoke(app, ["deploy", str(tmp_path)])
 
         assert result.exit_code == 0
         assert "Ready the chicken!" in result.output
 
-        # This is a long wait, so LONG_WAIT_MESSAGES should be accessed by the `cycle`
-        # function.
-        assert call(wait.LONG_WAIT_MESSAGES) in cycle_spy.call_args_list
+        # LONG_WAIT_MESSAGES should only be accessed by the `cycle` function once
+        # the wait gets long.
+        used_long_wait_messages = (
+            call(wait.LONG_WAIT_MESSAGES) in cycle_spy.call_args_list
+        )
+        assert used_long_wait_messages is is_long_wait
 
 
 @pytest.mark.respx
 def test_calls_upload_cancelled_when_user_interrupts(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
@@ -1622,33 +1295,31 @@ def test_calls_upload_cancelled_when_user_interrupts(
 
     upload_cancelled_route = respx_mock.post(
         f"/deployments/{deployment_data['id']}/upload-cancelled"
-    ).mock(return_value=Response(200))
+    ).mock(return_value=_OK_RESPONSE)
 
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.commands.deploy.command._upload_deployment",
-            side_effect=KeyboardInterrupt(),
-        ),
-    ):
-        runner.invoke(app, ["deploy"])
+    monkeypatch.setattr(
+        "fastapi_cloud_cli.commands.deploy.command._upload_deployment",
+        _raising(KeyboardInterrupt()),
+    )
+
+    runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert upload_cancelled_route.called
+    assert upload_cancelled_route.called
 
 
 @pytest.mark.respx
 def test_cancel_upload_swallows_exceptions(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
@@ -1659,17 +1330,15 @@ def test_cancel_upload_swallows_exceptions(
         f"/deployments/{deployment_data['id']}/upload-cancelled"
     ).mock(return_value=Response(500))
 
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.commands.deploy.command._upload_deployment",
-            side_effect=KeyboardInterrupt(),
-        ),
-    ):
-        result = runner.invoke(app, ["deploy"])
+    monkeypatch.setattr(
+        "fastapi_cloud_cli.commands.deploy.command._upload_deployment",
+        _raising(KeyboardInterrupt()),
+    )
+
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert upload_cancelled_route.called
-        assert "HTTPStatusError" not in result.output
+    assert upload_cancelled_route.called
+    assert "HTTPStatusError" not in result.output
 
 
 def _mock_deploy_until_upload(
@@ -1681,19 +1350,14 @@ def _mock_deploy_until_upload(
 ) -> None:
     app_id = app_data["id"]
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "some-team-id"}}')
+    _write_app_config(tmp_path, app_id, "some-team-id")
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
     respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
+        return_value=_UPLOAD_URL_RESPONSE
     )
     respx_mock.post("http://test.com", data={"key": "value"}).mock(
         return_value=upload_response
@@ -1708,9 +1372,7 @@ def _mock_deploy_until_deployment_creation(
 ) -> respx.Route:
     app_id = app_data["id"]
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "some-team-id"}}')
+    _write_app_config(tmp_path, app_id, "some-team-id")
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
 
@@ -1738,8 +1400,7 @@ def test_deploy_shows_error_when_creation_rejects_archive_size(
         ),
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     output = " ".join(result.output.split())
 
@@ -1770,8 +1431,7 @@ def test_deploy_json_shows_error_when_creation_rejects_archive_size(
         ),
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--json"])
 
     assert result.exit_code == 1
 
@@ -1801,27 +1461,23 @@ def test_deploy_shows_error_when_upload_fails(
         Response(400, text="not an xml body"),
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 1
     assert "Something went wrong" in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_deploy_successfully_with_token(
     logged_out_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}", headers={"Authorization": "Bearer hello"}).mock(
         return_value=Response(200, json=app_data)
@@ -1834,15 +1490,10 @@ def test_deploy_successfully_with_token(
     respx_mock.post(
         f"/deployments/{deployment_data['id']}/upload",
         headers={"Authorization": "Bearer hello"},
-    ).mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
+    ).mock(return_value=_UPLOAD_URL_RESPONSE)
 
     respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
+        return_value=_OK_RESPONSE
     )
 
     respx_mock.get(
@@ -1851,11 +1502,7 @@ def test_deploy_successfully_with_token(
     ).mock(
         return_value=Response(
             200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "message", "message": "All good!", "id": "2"},
-                {"type": "complete"},
-            ),
+            content=_BUILD_LOGS_ALL_GOOD,
         )
     )
 
@@ -1873,19 +1520,18 @@ def test_deploy_successfully_with_token(
         headers={"Authorization": "Bearer hello"},
     ).mock(return_value=Response(200, json={**deployment_data, "status": "success"}))
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"], env={"FASTAPI_CLOUD_TOKEN": "hello"})
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path)], env={"FASTAPI_CLOUD_TOKEN": "hello"}
+    )
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
 
-        # check that logs are shown
-        assert "All good!" in result.output
-        assert (
-            "Using token from FASTAPI_CLOUD_TOKEN environment variable" in result.output
-        )
+    # check that logs are shown
+    assert "All good!" in result.output
+    assert "Using token from FASTAPI_CLOUD_TOKEN environment variable" in result.output
 
-        # check that the app URL is shown
-        assert deployment_data["url"] in result.output
+    # check that the app URL is shown
+    assert deployment_data["url"] in result.output
 
 
 @pytest.mark.respx
@@ -1893,28 +1539,25 @@ def test_deploy_with_token_fails(
     logged_out_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
-
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
+    team_id = "some-team-id"
 
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}", headers={"Authorization": "Bearer hello"}).mock(
         return_value=Response(401, json=app_data)
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"], env={"FASTAPI_CLOUD_TOKEN": "hello"})
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path)], env={"FASTAPI_CLOUD_TOKEN": "hello"}
+    )
 
-        assert result.exit_code == 1
+    assert result.exit_code == 1
 
-        assert (
-            "The specified token is not valid. Make sure to use a valid token."
-            in result.output
-        )
+    assert (
+        "The specified token is not valid. Make sure to use a valid token."
+        in result.output
+    )
 
 
 @pytest.mark.parametrize(
@@ -1945,6 +1588,7 @@ def test_deploy_with_token_fails(
     ],
 )
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_upload_deployment_progress(
     logged_in_cli: None,
     tmp_path: Path,
@@ -1953,183 +1597,65 @@ def test_upload_deployment_progress(
     expected_msgs: list[str],
 ) -> None:
     app_data = _get_random_app()
-    team_data = _get_random_team()
     app_id = app_data["id"]
-    team_id = team_data["id"]
+    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
     deployment_id = deployment_data["id"]
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    (tmp_path / "file.bin").write_bytes(random.randbytes(size))
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_id}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_id}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-    respx_mock.get(f"/deployments/{deployment_id}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
-    respx_mock.get(f"/deployments/{deployment_id}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
-    )
-
-    with (
-        changing_dir(tmp_path),
-        patch.object(Progress, "log") as mock_progress,
-    ):
-        result = runner.invoke(app, ["deploy"])
-        assert result.exit_code == 0
-
-    call_args = [
-        c.args[0] for c in mock_progress.call_args_list if isinstance(c.args[0], str)
-    ]
-
-    for expected_msg in expected_msgs:
-        pattern = re.compile(f"Uploading deployment {expected_msg}\\.\\.\\.")
-        assert any(pattern.match(arg) for arg in call_args), (
-            f"Expected message '{pattern.pattern}' not found in {call_args}"
-        )
-
-
-@pytest.mark.respx
-def test_deploy_with_app_id_arg(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
-) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
-    )
-
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", app_id])
-
-        assert result.exit_code == 0
-        assert f"Deploying to app {app_id}" in result.output
-
+    _write_app_config(tmp_path, app_id, team_id)
 
-@pytest.mark.respx
-def test_deploy_with_app_id_from_env_var(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
-) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    deployment_data = _get_random_deployment(app_id=app_id)
+    # Incompressible content keeps the archive close to `size`, seeded so every
+    # run uploads the same bytes
+    (tmp_path / "file.bin").write_bytes(random.Random(0).randbytes(size))
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
+    _mock_upload_pipeline(respx_mock, deployment_data)
+    respx_mock.get(f"/deployments/{deployment_id}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"], env={"FASTAPI_CLOUD_APP_ID": app_id})
-
+    with patch.object(Progress, "log") as mock_progress:
+        result = runner.invoke(app, ["deploy", str(tmp_path)])
         assert result.exit_code == 0
-        assert f"Deploying to app {app_id}" in result.output
+
+    call_args = [
+        c.args[0] for c in mock_progress.call_args_list if isinstance(c.args[0], str)
+    ]
+
+    for expected_msg in expected_msgs:
+        pattern = re.compile(f"Uploading deployment {expected_msg}\\.\\.\\.")
+        assert any(pattern.match(arg) for arg in call_args), (
+            f"Expected message '{pattern.pattern}' not found in {call_args}"
+        )
 
 
 @pytest.mark.respx
-def test_deploy_with_app_id_matching_local_config(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+@pytest.mark.deploy_flow
+@pytest.mark.parametrize(
+    "use_arg,use_env,use_local_config",
+    [
+        pytest.param(True, False, False, id="arg"),
+        pytest.param(False, True, False, id="env-var"),
+        pytest.param(True, False, True, id="arg-matching-local-config"),
+    ],
+)
+def test_deploy_with_app_id(
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    use_arg: bool,
+    use_env: bool,
+    use_local_config: bool,
 ) -> None:
     app_data = _get_random_app()
     app_id = app_data["id"]
-    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    if use_local_config:
+        _write_app_config(tmp_path, app_id, "some-team-id")
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
 
@@ -2137,44 +1663,21 @@ def test_deploy_with_app_id_matching_local_config(
         return_value=Response(201, json=deployment_data)
     )
 
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200,
-            json={"url": "http://test.com", "fields": {"key": "value"}},
-        )
-    )
-
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data)
 
     respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
         return_value=Response(200, json={**deployment_data, "status": "success"})
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", app_id])
+    args = ["--app-id", app_id] if use_arg else []
+    env = {"FASTAPI_CLOUD_APP_ID": app_id} if use_env else {}
 
-        assert result.exit_code == 0
-        # Should NOT show mismatch warning
-        assert "does not match" not in result.output
-        assert f"Deploying to app {app_id}" in result.output
+    result = runner.invoke(app, ["deploy", str(tmp_path), *args], env=env)
+
+    assert result.exit_code == 0
+    # Should NOT show mismatch warning
+    assert "does not match" not in result.output
+    assert f"Deploying to app {app_id}" in result.output
 
 
 @pytest.mark.respx
@@ -2185,19 +1688,16 @@ def test_deploy_with_app_id_mismatch_fails(
     local_app_id = local_app_data["id"]
     team_id = "some-team-id"
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{local_app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, local_app_id, team_id)
 
     cli_app_id = "different-app-id"
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", cli_app_id])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--app-id", cli_app_id])
 
-        assert result.exit_code == 1
-        assert "does not match" in result.output
-        assert "fastapi cloud unlink" in result.output
-        assert "FASTAPI_CLOUD_APP_ID" in result.output
+    assert result.exit_code == 1
+    assert "does not match" in result.output
+    assert "fastapi cloud unlink" in result.output
+    assert "FASTAPI_CLOUD_APP_ID" in result.output
 
 
 def test_deploy_json_with_app_id_mismatch_returns_invalid_input(
@@ -2207,12 +1707,11 @@ def test_deploy_json_with_app_id_mismatch_returns_invalid_input(
     team_id = "some-team-id"
     cli_app_id = "different-app-id"
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{local_app_id}", "team_id": "{team_id}"}}')
+    _write_app_config(tmp_path, local_app_id, team_id)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", cli_app_id, "--json"])
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path), "--app-id", cli_app_id, "--json"]
+    )
 
     assert result.exit_code == 1
     assert json.loads(result.stdout) == {
@@ -2238,13 +1737,12 @@ def test_deploy_with_app_id_arg_app_not_found(
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(404))
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", app_id])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--app-id", app_id])
 
-        assert result.exit_code == 1
-        assert "App not found" in result.output
-        # Should NOT show unlink tip when using --app-id
-        assert "unlink" not in result.output
+    assert result.exit_code == 1
+    assert "App not found" in result.output
+    # Should NOT show unlink tip when using --app-id
+    assert "unlink" not in result.output
 
 
 @pytest.mark.respx
@@ -2255,8 +1753,7 @@ def test_deploy_json_with_app_id_arg_app_not_found(
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(404))
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--app-id", app_id, "--json"])
+    result = runner.invoke(app, ["deploy", str(tmp_path), "--app-id", app_id, "--json"])
 
     assert result.exit_code == 1
     assert json.loads(result.stdout) == {
@@ -2270,220 +1767,178 @@ def test_deploy_json_with_app_id_arg_app_not_found(
 
 def _setup_deployment_mocks(
     respx_mock: respx.MockRouter,
-    app_id: str,
+    app_data: RandomApp,
     team_id: str,
     deployment_data: dict[str, str],
     tmp_path: Path,
+    *,
+    build_logs: str | None = _BUILD_LOGS_OK,
 ) -> None:
     """Set up common deployment mocks for a configured app."""
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
+    app_id = app_data["id"]
 
-    app_data = _get_random_app()
-    app_data["id"] = app_id
+    _write_app_config(tmp_path, app_id, team_id)
 
     respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
     respx_mock.post(f"/apps/{app_id}/deployments/").mock(
         return_value=Response(201, json=deployment_data)
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
-    )
-    respx_mock.get(f"/deployments/{deployment_data['id']}/build-logs").mock(
-        return_value=Response(
-            200,
-            content=build_logs_response(
-                {"type": "message", "message": "Building...", "id": "1"},
-                {"type": "complete"},
-            ),
-        )
-    )
+    _mock_upload_pipeline(respx_mock, deployment_data, build_logs=build_logs)
 
 
-@pytest.mark.respx
-def test_verification_failure_after_build_complete(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
-) -> None:
+@pytest.fixture
+def configured_deployment(
+    respx_mock: respx.MockRouter, tmp_path: Path
+) -> dict[str, str]:
+    """Link tmp_path to a new app and mock its deployment requests.
+
+    Writes .fastapicloud/cloud.json and registers the app, deployment and upload
+    routes, returning the deployment payload.
+    """
     app_data = _get_random_app()
     app_id = app_data["id"]
-    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
+    _setup_deployment_mocks(
+        respx_mock, app_data, "some-team-id", deployment_data, tmp_path
+    )
 
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
+    return deployment_data
+
+
+@pytest.mark.respx
+@pytest.mark.deploy_flow
+def test_verification_failure_after_build_complete(
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
+) -> None:
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
         return_value=Response(
-            200, json={**deployment_data, "status": "verifying_failed"}
+            200, json={**configured_deployment, "status": "verifying_failed"}
         )
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 1
-        assert "Deployment failed" in result.output
-        assert "Verification Failed" in result.output
-        assert deployment_data["dashboard_url"] in result.output
+    assert result.exit_code == 1
+    assert "Deployment failed" in result.output
+    assert "Verification Failed" in result.output
+    assert configured_deployment["dashboard_url"] in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_polling_with_intermediate_states(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-
     call_count = 0
 
     def poll_handler(request: httpx.Request, route: respx.Route) -> Response:
         nonlocal call_count
         call_count += 1
         if call_count <= 2:
-            return Response(200, json={**deployment_data, "status": "verifying"})
-        return Response(200, json={**deployment_data, "status": "success"})
+            return Response(200, json={**configured_deployment, "status": "verifying"})
+        return Response(200, json={**configured_deployment, "status": "success"})
 
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
         side_effect=poll_handler
     )
 
-    with changing_dir(tmp_path), patch("time.sleep"):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert deployment_data["url"] in result.output
+    assert result.exit_code == 0
+    assert configured_deployment["url"] in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_polling_timeout_shows_dashboard_link(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
+    monkeypatch.setattr(
+        "fastapi_cloud_cli.utils.api.APIClient.poll_deployment_status",
+        _raising(TimeoutError("Deployment verification timed out")),
+    )
 
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.utils.api.APIClient.poll_deployment_status",
-            side_effect=TimeoutError("Deployment verification timed out"),
-        ),
-    ):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert "Could not confirm deployment status" in result.output
-        assert deployment_data["dashboard_url"] in result.output
+    assert result.exit_code == 0
+    assert "Could not confirm deployment status" in result.output
+    assert configured_deployment["dashboard_url"] in result.output
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_verifying_skipped_treated_as_success(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
         return_value=Response(
-            200, json={**deployment_data, "status": "verifying_skipped"}
+            200, json={**configured_deployment, "status": "verifying_skipped"}
         )
     )
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert deployment_data["url"] in result.output
+    assert result.exit_code == 0
+    assert configured_deployment["url"] in result.output
 
 
 @pytest.mark.respx
-def test_ctrl_c_during_verification_shows_cancelled(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
-) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.utils.api.APIClient.poll_deployment_status",
-            side_effect=KeyboardInterrupt(),
+@pytest.mark.parametrize(
+    "interrupted_method,build_logs",
+    [
+        pytest.param("stream_build_logs", None, id="build-streaming"),
+        pytest.param(
+            "poll_deployment_status",
+            _BUILD_LOGS_OK,
+            id="verification",
+            marks=pytest.mark.deploy_flow,
         ),
-    ):
-        result = runner.invoke(app, ["deploy"])
-
-        assert "🟡" in result.output
-        assert "Cancelled" in result.output
-        assert "✅" not in result.output
-
-
-@pytest.mark.respx
-def test_ctrl_c_during_build_streaming_shows_cancelled(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    ],
+)
+def test_ctrl_c_shows_cancelled(
+    logged_in_cli: None,
+    tmp_path: Path,
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+    interrupted_method: str,
+    build_logs: str | None,
 ) -> None:
     app_data = _get_random_app()
     app_id = app_data["id"]
-    team_id = "some-team-id"
     deployment_data = _get_random_deployment(app_id=app_id)
 
-    config_path = tmp_path / ".fastapicloud" / "cloud.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'{{"app_id": "{app_id}", "team_id": "{team_id}"}}')
-
-    respx_mock.get(f"/apps/{app_id}").mock(return_value=Response(200, json=app_data))
-    respx_mock.post(f"/apps/{app_id}/deployments/").mock(
-        return_value=Response(201, json=deployment_data)
-    )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload").mock(
-        return_value=Response(
-            200, json={"url": "http://test.com", "fields": {"key": "value"}}
-        )
-    )
-    respx_mock.post("http://test.com", data={"key": "value"}).mock(
-        return_value=Response(200)
+    _setup_deployment_mocks(
+        respx_mock,
+        app_data,
+        "some-team-id",
+        deployment_data,
+        tmp_path,
+        build_logs=build_logs,
     )
-    respx_mock.post(f"/deployments/{deployment_data['id']}/upload-complete").mock(
-        return_value=Response(
-            200, json={**deployment_data, "status": "ready_for_build"}
-        )
+
+    monkeypatch.setattr(
+        f"fastapi_cloud_cli.utils.api.APIClient.{interrupted_method}",
+        _raising(KeyboardInterrupt()),
     )
 
-    with (
-        changing_dir(tmp_path),
-        patch(
-            "fastapi_cloud_cli.utils.api.APIClient.stream_build_logs",
-            side_effect=KeyboardInterrupt(),
-        ),
-    ):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
-        assert "🟡" in result.output
-        assert "Cancelled." in result.output
+    assert "🟡" in result.output
+    assert "Cancelled." in result.output
+    assert "✅" not in result.output
 
 
 def _create_file(path: Path, size_bytes: int) -> None:
@@ -2496,24 +1951,21 @@ def _create_file(path: Path, size_bytes: int) -> None:
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_large_file_threshold_warning(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
+        return_value=Response(200, json={**configured_deployment, "status": "success"})
     )
 
     _create_file(tmp_path / "model.bin", 12 * 1024 * 1024)  # 12 MB
     _create_file(tmp_path / "data.csv", 10 * 1024 * 1024 + 1)  # 10+ MB
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 0
     assert "Some uploaded files are larger than 10 MB" in result.output
@@ -2524,17 +1976,15 @@ def test_large_file_threshold_warning(
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_large_file_threshold_only_top_three_files_with_more_indicator(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
+        return_value=Response(200, json={**configured_deployment, "status": "success"})
     )
 
     _create_file(tmp_path / "huge.bin", 50 * 1024 * 1024)
@@ -2543,8 +1993,7 @@ def test_large_file_threshold_only_top_three_files_with_more_indicator(
     _create_file(tmp_path / "smaller.bin", 20 * 1024 * 1024)
     _create_file(tmp_path / "smallest.bin", 15 * 1024 * 1024)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 0
     assert "huge.bin" in result.output
@@ -2556,25 +2005,22 @@ def test_large_file_threshold_only_top_three_files_with_more_indicator(
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_large_file_threshold_does_not_warn_when_no_large_files(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
+        return_value=Response(200, json={**configured_deployment, "status": "success"})
     )
 
     # Files are less or equal to 10 MB (default threshold), so no warning should be shown
     _create_file(tmp_path / "data.bin", 5 * 1024 * 1024)
     _create_file(tmp_path / "data.bin", 10 * 1024 * 1024)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy"])
+    result = runner.invoke(app, ["deploy", str(tmp_path)])
 
     assert result.exit_code == 0
     assert "Some uploaded files are larger than" not in result.output
@@ -2582,24 +2028,23 @@ def test_large_file_threshold_does_not_warn_when_no_large_files(
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_large_file_threshold_custom_threshold(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
+        return_value=Response(200, json={**configured_deployment, "status": "success"})
     )
 
     # 5 MB file: above a 1 MB threshold, below the default 10 MB threshold
     _create_file(tmp_path / "data.bin", 5 * 1024 * 1024)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--large-file-threshold", "1"])
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path), "--large-file-threshold", "1"]
+    )
 
     assert result.exit_code == 0
     assert "Some uploaded files are larger than 1 MB" in result.output
@@ -2607,26 +2052,23 @@ def test_large_file_threshold_custom_threshold(
 
 
 @pytest.mark.respx
+@pytest.mark.deploy_flow
 def test_large_file_threshold_custom_threshold_envvar(
-    logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
+    logged_in_cli: None,
+    tmp_path: Path,
+    configured_deployment: dict[str, str],
+    respx_mock: respx.MockRouter,
 ) -> None:
-    app_data = _get_random_app()
-    app_id = app_data["id"]
-    team_id = "some-team-id"
-    deployment_data = _get_random_deployment(app_id=app_id)
-
-    _setup_deployment_mocks(respx_mock, app_id, team_id, deployment_data, tmp_path)
-    respx_mock.get(f"/deployments/{deployment_data['id']}").mock(
-        return_value=Response(200, json={**deployment_data, "status": "success"})
+    respx_mock.get(f"/deployments/{configured_deployment['id']}").mock(
+        return_value=Response(200, json={**configured_deployment, "status": "success"})
     )
 
     # 5 MB file: above a 1 MB threshold, below the default 10 MB threshold
     _create_file(tmp_path / "data.bin", 5 * 1024 * 1024)
 
-    with changing_dir(tmp_path):
-        result = runner.invoke(
-            app, ["deploy"], env={"FASTAPI_CLOUD_LARGE_FILE_THRESHOLD": "1"}
-        )
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path)], env={"FASTAPI_CLOUD_LARGE_FILE_THRESHOLD": "1"}
+    )
 
     assert result.exit_code == 0
     assert "Some uploaded files are larger than 1 MB" in result.output
@@ -2637,8 +2079,9 @@ def test_large_file_threshold_custom_threshold_envvar(
 def test_invalid_large_file_threshold(
     logged_in_cli: None, tmp_path: Path, respx_mock: respx.MockRouter
 ) -> None:
-    with changing_dir(tmp_path):
-        result = runner.invoke(app, ["deploy", "--large-file-threshold", "0"])
+    result = runner.invoke(
+        app, ["deploy", str(tmp_path), "--large-file-threshold", "0"]
+    )
 
     assert result.exit_code == 2
     assert "Invalid value for '--large-file-threshold'" in result.output
@@ -1,7 +1,9 @@
 import subprocess
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
 from pathlib import Path, PureWindowsPath
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import respx
@@ -10,11 +12,13 @@ from typer.testing import CliRunner
 
 from fastapi_cloud_cli.cli import cloud_app as app
 from fastapi_cloud_cli.commands.setup_ci import (
+    DEFAULT_WORKFLOW_PATH,
     GitHubSecretError,
     _check_gh_cli_installed,
     _check_git_installed,
     _format_workflow_path,
     _get_default_branch,
+    _get_github_host,
     _get_remote_origin,
     _resolve_existing_workflow_path,
     _set_github_secret,
@@ -28,17 +32,73 @@ runner = CliRunner()
 GITHUB_ORIGIN = "git@github.com:owner/repo.git"
 GITLAB_ORIGIN = "git@gitlab.com:owner/repo.git"
 
+_TOKEN_EXPIRED_AT = "2027-02-18T00:00:00Z"
+_TOKEN_CREATED_RESPONSE = Response(
+    201, json={"value": "test-token", "expired_at": _TOKEN_EXPIRED_AT}
+)
+
 
 def _mock_token_api(
-    respx_mock: respx.MockRouter, app_id: str, *, token_value: str = "test-token"
+    respx_mock: respx.MockRouter, app_id: str, *, token_value: str | None = None
 ) -> None:
     """Set up token API mocks for tests that create tokens."""
-    respx_mock.post(f"/apps/{app_id}/tokens").mock(
-        return_value=Response(
-            201,
-            json={"value": token_value, "expired_at": "2027-02-18T00:00:00Z"},
-        )
+    response = (
+        _TOKEN_CREATED_RESPONSE
+        if token_value is None
+        else Response(201, json={"value": token_value, "expired_at": _TOKEN_EXPIRED_AT})
     )
+    respx_mock.post(f"/apps/{app_id}/tokens").mock(return_value=response)
+
+
+@pytest.fixture
+def token_api(respx_mock: respx.MockRouter, configured_app: ConfiguredApp) -> None:
+    _mock_token_api(respx_mock, configured_app.app_id)
+
+
+@dataclass
+class SetupCIEnv:
+    set_github_secret: MagicMock
+
+
+@pytest.fixture
+def setup_ci_env(
+    request: pytest.FixtureRequest, configured_app: ConfiguredApp
+) -> Generator[SetupCIEnv, None, None]:
+    """Run from the configured app with git and gh detection stubbed out.
+
+    Parametrize indirectly with a dict to override ``origin``,
+    ``default_branch`` or ``gh_installed``.
+    """
+    options = getattr(request, "param", {})
+
+    with (
+        changing_dir(configured_app.path),
+        patch(
+            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
+            return_value=options.get("origin", GITHUB_ORIGIN),
+        ),
+        patch(
+            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
+            return_value=options.get("gh_installed", True),
+        ),
+        patch(
+            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
+            return_value=options.get("default_branch", "main"),
+        ),
+        patch(
+            "fastapi_cloud_cli.commands.setup_ci._set_github_secret"
+        ) as set_github_secret,
+    ):
+        yield SetupCIEnv(set_github_secret=set_github_secret)
+
+
+@pytest.fixture
+def existing_workflow(configured_app: ConfiguredApp) -> Path:
+    workflow_path = configured_app.path / DEFAULT_WORKFLOW_PATH
+    workflow_path.parent.mkdir(parents=True)
+    workflow_path.write_text("old content")
+
+    return workflow_path
 
 
 def test_shows_login_message_when_not_logged_in(logged_out_cli: None) -> None:
@@ -96,17 +156,11 @@ def test_exits_with_error_when_no_remote_origin(
     assert "Could not retrieve the git remote origin URL" in result.output
 
 
+@pytest.mark.parametrize("setup_ci_env", [{"origin": GITLAB_ORIGIN}], indirect=True)
 def test_shows_error_when_origin_is_not_github(
-    logged_in_cli: None, configured_app: ConfiguredApp
+    logged_in_cli: None, setup_ci_env: SetupCIEnv
 ) -> None:
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITLAB_ORIGIN,
-        ),
-    ):
-        result = runner.invoke(app, ["setup-ci"])
+    result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 1
     assert "Remote origin is not a GitHub repository" in result.output
@@ -115,28 +169,10 @@ def test_shows_error_when_origin_is_not_github(
 @pytest.mark.respx
 def test_detects_github_origin_and_completes_successfully(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
@@ -177,30 +213,13 @@ def test_app_id_option_works_without_linked_directory(
 
 
 @pytest.mark.respx
+@pytest.mark.parametrize("setup_ci_env", [{"default_branch": "develop"}], indirect=True)
 def test_detects_non_main_default_branch(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="develop",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
@@ -223,28 +242,27 @@ def test_get_default_branch_returns_branch_name() -> None:
         assert _get_default_branch() == "develop"
 
 
-def test_check_git_installed_returns_true() -> None:
-    with patch(
-        "fastapi_cloud_cli.commands.setup_ci.shutil.which", return_value="/usr/bin/git"
-    ):
-        assert _check_git_installed() is True
-
-
-def test_check_git_installed_returns_false_when_missing() -> None:
-    with patch("fastapi_cloud_cli.commands.setup_ci.shutil.which", return_value=None):
-        assert _check_git_installed() is False
-
-
-def test_check_gh_cli_installed_returns_true() -> None:
+@pytest.mark.parametrize(
+    ("check_installed", "executable"),
+    [(_check_git_installed, "/usr/bin/git"), (_check_gh_cli_installed, "/usr/bin/gh")],
+)
+def test_check_installed_returns_true(
+    check_installed: Callable[[], bool], executable: str
+) -> None:
     with patch(
-        "fastapi_cloud_cli.commands.setup_ci.shutil.which", return_value="/usr/bin/gh"
+        "fastapi_cloud_cli.commands.setup_ci.shutil.which", return_value=executable
     ):
-        assert _check_gh_cli_installed() is True
+        assert check_installed() is True
 
 
-def test_check_gh_cli_installed_returns_false_when_missing() -> None:
+@pytest.mark.parametrize(
+    "check_installed", [_check_git_installed, _check_gh_cli_installed]
+)
+def test_check_installed_returns_false_when_missing(
+    check_installed: Callable[[], bool],
+) -> None:
     with patch("fastapi_cloud_cli.commands.setup_ci.shutil.which", return_value=None):
-        assert _check_gh_cli_installed() is False
+        assert check_installed() is False
 
 
 def test_format_workflow_path_uses_forward_slashes() -> None:
@@ -327,24 +345,10 @@ def test_set_github_secret_raises_custom_exception_when_gh_not_found() -> None:
 
 
 def test_dry_run_shows_planned_steps(
-    logged_in_cli: None, configured_app: ConfiguredApp
+    logged_in_cli: None,
+    setup_ci_env: SetupCIEnv,
 ) -> None:
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-    ):
-        result = runner.invoke(app, ["setup-ci", "--dry-run"])
+    result = runner.invoke(app, ["setup-ci", "--dry-run"])
 
     assert result.exit_code == 0
     assert "dry run" in result.output.lower()
@@ -355,24 +359,10 @@ def test_dry_run_shows_planned_steps(
 
 
 def test_dry_run_secrets_only_skips_workflow(
-    logged_in_cli: None, configured_app: ConfiguredApp
+    logged_in_cli: None,
+    setup_ci_env: SetupCIEnv,
 ) -> None:
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-    ):
-        result = runner.invoke(app, ["setup-ci", "--dry-run", "--secrets-only"])
+    result = runner.invoke(app, ["setup-ci", "--dry-run", "--secrets-only"])
 
     assert result.exit_code == 0
     assert "FASTAPI_CLOUD_TOKEN" in result.output
@@ -383,27 +373,10 @@ def test_dry_run_secrets_only_skips_workflow(
 def test_secrets_only_skips_workflow_file(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci", "--secrets-only"])
 
     assert result.exit_code == 0
@@ -417,27 +390,10 @@ def test_secrets_only_skips_workflow_file(
 def test_branch_flag_overrides_detected_branch(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci", "--branch", "production"])
 
     assert result.exit_code == 0
@@ -452,28 +408,13 @@ def test_branch_flag_overrides_detected_branch(
 def test_creates_token_sets_secrets_and_writes_workflow(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
+    setup_ci_env: SetupCIEnv,
     respx_mock: respx.MockRouter,
 ) -> None:
     app_id = configured_app.app_id
     _mock_token_api(respx_mock, app_id, token_value="test-token-value")
 
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
@@ -485,8 +426,10 @@ def test_creates_token_sets_secrets_and_writes_workflow(
     assert "2027-02-18" in result.output
     assert "test-token-value" not in result.output
 
-    mock_secret.assert_any_call("FASTAPI_CLOUD_TOKEN", "test-token-value")
-    mock_secret.assert_any_call("FASTAPI_CLOUD_APP_ID", app_id)
+    assert setup_ci_env.set_github_secret.call_args_list == [
+        call("FASTAPI_CLOUD_TOKEN", "test-token-value"),
+        call("FASTAPI_CLOUD_APP_ID", app_id),
+    ]
 
     workflow_file = configured_app.path / ".github" / "workflows" / "deploy.yml"
     assert workflow_file.exists()
@@ -498,56 +441,29 @@ def test_creates_token_sets_secrets_and_writes_workflow(
 def test_declining_token_creation_skips_token_and_secret_setup(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
+    setup_ci_env: SetupCIEnv,
 ) -> None:
     with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
         patch.object(FastAPIRichToolkit, "confirm", return_value=False),
         patch("fastapi_cloud_cli.commands.setup_ci._create_token") as mock_create_token,
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
     ):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
     assert "Skipped creating deploy token and GitHub secrets" in result.output
     mock_create_token.assert_not_called()
-    mock_secret.assert_not_called()
+    setup_ci_env.set_github_secret.assert_not_called()
     workflow_file = configured_app.path / ".github" / "workflows" / "deploy.yml"
     assert workflow_file.exists()
 
 
 def test_declining_token_creation_for_secrets_only_finishes_without_setup(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
+    setup_ci_env: SetupCIEnv,
 ) -> None:
     with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
         patch.object(FastAPIRichToolkit, "confirm", return_value=False),
         patch("fastapi_cloud_cli.commands.setup_ci._create_token") as mock_create_token,
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
     ):
         result = runner.invoke(app, ["setup-ci", "--secrets-only"])
 
@@ -555,70 +471,37 @@ def test_declining_token_creation_for_secrets_only_finishes_without_setup(
     assert "Skipped creating deploy token and GitHub secrets" in result.output
     assert "Done" in result.output
     mock_create_token.assert_not_called()
-    mock_secret.assert_not_called()
+    setup_ci_env.set_github_secret.assert_not_called()
 
 
 @pytest.mark.respx
 def test_declining_github_secret_setup_keeps_created_token(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch.object(FastAPIRichToolkit, "confirm", side_effect=[True, False]),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", side_effect=[True, False]):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
     assert "Created deploy token" in result.output
     assert "Skipped setting GitHub Actions secrets" in result.output
     assert "2027-02-18" in result.output
-    mock_secret.assert_not_called()
+    setup_ci_env.set_github_secret.assert_not_called()
     workflow_file = configured_app.path / ".github" / "workflows" / "deploy.yml"
     assert workflow_file.exists()
 
 
 @pytest.mark.respx
+@pytest.mark.parametrize("setup_ci_env", [{"gh_installed": False}], indirect=True)
 def test_shows_manual_instructions_when_gh_not_installed(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=False,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
@@ -628,39 +511,20 @@ def test_shows_manual_instructions_when_gh_not_installed(
     assert f"FASTAPI_CLOUD_APP_ID = {configured_app.app_id}" in result.output
     assert "Done" in result.output
     assert "2027-02-18" in result.output
-    mock_secret.assert_not_called()
+    setup_ci_env.set_github_secret.assert_not_called()
 
 
 @pytest.mark.respx
 def test_handles_gh_command_errors_gracefully(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
+    setup_ci_env.set_github_secret.side_effect = GitHubSecretError(
+        "Failed to set GitHub secret 'FASTAPI_CLOUD_TOKEN'"
+    )
 
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._set_github_secret",
-            side_effect=GitHubSecretError(
-                "Failed to set GitHub secret 'FASTAPI_CLOUD_TOKEN'"
-            ),
-        ),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 1
@@ -671,27 +535,10 @@ def test_handles_gh_command_errors_gracefully(
 def test_file_flag_uses_custom_filename(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci", "--file", "ci.yml"])
 
     assert result.exit_code == 0
@@ -702,184 +549,91 @@ def test_file_flag_uses_custom_filename(
 @pytest.mark.respx
 def test_overwrites_existing_workflow_when_confirmed(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    existing_workflow: Path,
+    setup_ci_env: SetupCIEnv,
+    mock_getchar: MagicMock,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    workflow_dir = configured_app.path / ".github" / "workflows"
-    workflow_dir.mkdir(parents=True)
-    (workflow_dir / "deploy.yml").write_text("old content")
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = [Keys.ENTER, Keys.ENTER, Keys.ENTER]
-        result = runner.invoke(app, ["setup-ci"])
+    mock_getchar.side_effect = [Keys.ENTER, Keys.ENTER, Keys.ENTER]
+    result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
     assert "already exists" in result.output
-    assert "Deploy to FastAPI Cloud" in (workflow_dir / "deploy.yml").read_text()
+    assert "Deploy to FastAPI Cloud" in existing_workflow.read_text()
 
 
 @pytest.mark.respx
 def test_skips_writing_workflow_when_declined(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    existing_workflow: Path,
+    setup_ci_env: SetupCIEnv,
+    mock_getchar: MagicMock,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    workflow_dir = configured_app.path / ".github" / "workflows"
-    workflow_dir.mkdir(parents=True)
-    (workflow_dir / "deploy.yml").write_text("old content")
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = [
-            Keys.ENTER,
-            Keys.ENTER,
-            Keys.RIGHT_ARROW,
-            Keys.ENTER,
-            Keys.ENTER,
-        ]
-        result = runner.invoke(app, ["setup-ci"])
+    mock_getchar.side_effect = [
+        Keys.ENTER,
+        Keys.ENTER,
+        Keys.RIGHT_ARROW,
+        Keys.ENTER,
+        Keys.ENTER,
+    ]
+    result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
     assert "Skipped writing workflow file" in result.output
-    assert (workflow_dir / "deploy.yml").read_text() == "old content"
+    assert existing_workflow.read_text() == "old content"
 
 
 @pytest.mark.respx
 def test_renames_workflow_when_declined_and_new_name_given(
     logged_in_cli: None,
-    configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    existing_workflow: Path,
+    setup_ci_env: SetupCIEnv,
+    mock_getchar: MagicMock,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-
-    workflow_dir = configured_app.path / ".github" / "workflows"
-    workflow_dir.mkdir(parents=True)
-    (workflow_dir / "deploy.yml").write_text("old content")
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=GITHUB_ORIGIN,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=True,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret"),
-        patch("rich_toolkit.container.getchar") as mock_getchar,
-    ):
-        mock_getchar.side_effect = [
-            Keys.ENTER,
-            Keys.ENTER,
-            Keys.RIGHT_ARROW,
-            Keys.ENTER,
-            *"ci-deploy.yml",
-            Keys.ENTER,
-        ]
-        result = runner.invoke(app, ["setup-ci"])
+    mock_getchar.side_effect = [
+        Keys.ENTER,
+        Keys.ENTER,
+        Keys.RIGHT_ARROW,
+        Keys.ENTER,
+        *"ci-deploy.yml",
+        Keys.ENTER,
+    ]
+    result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
     assert "ci-deploy.yml" in result.output
-    assert (workflow_dir / "deploy.yml").read_text() == "old content"
-    assert (workflow_dir / "ci-deploy.yml").exists()
-
-
-def test_get_github_host_extracts_from_ssh_url() -> None:
-    from fastapi_cloud_cli.commands.setup_ci import _get_github_host
-
-    assert _get_github_host("git@github.com:owner/repo.git") == "github.com"
-
-
-def test_get_github_host_extracts_from_https_url() -> None:
-    from fastapi_cloud_cli.commands.setup_ci import _get_github_host
-
-    assert _get_github_host("https://github.com/owner/repo.git") == "github.com"
-
-
-def test_get_github_host_extracts_from_enterprise_ssh_url() -> None:
-    from fastapi_cloud_cli.commands.setup_ci import _get_github_host
-
-    assert (
-        _get_github_host("git@github.enterprise.com:owner/repo.git")
-        == "github.enterprise.com"
-    )
-
-
-def test_get_github_host_extracts_from_enterprise_https_url() -> None:
-    from fastapi_cloud_cli.commands.setup_ci import _get_github_host
-
-    assert (
-        _get_github_host("https://github.enterprise.com/owner/repo.git")
-        == "github.enterprise.com"
-    )
+    assert existing_workflow.read_text() == "old content"
+    assert existing_workflow.with_name("ci-deploy.yml").exists()
+
+
+@pytest.mark.parametrize(
+    ("origin", "expected_host"),
+    [
+        ("git@github.com:owner/repo.git", "github.com"),
+        ("https://github.com/owner/repo.git", "github.com"),
+        ("git@github.enterprise.com:owner/repo.git", "github.enterprise.com"),
+        ("https://github.enterprise.com/owner/repo.git", "github.enterprise.com"),
+    ],
+)
+def test_get_github_host_extracts_host(origin: str, expected_host: str) -> None:
+    assert _get_github_host(origin) == expected_host
 
 
 @pytest.mark.respx
+@pytest.mark.parametrize(
+    "setup_ci_env",
+    [{"origin": "git@github.enterprise.com:owner/repo.git", "gh_installed": False}],
+    indirect=True,
+)
 def test_shows_enterprise_manual_secrets_url_when_gh_not_installed(
     logged_in_cli: None,
     configured_app: ConfiguredApp,
-    respx_mock: respx.MockRouter,
+    setup_ci_env: SetupCIEnv,
+    token_api: None,
 ) -> None:
-    _mock_token_api(respx_mock, configured_app.app_id)
-    enterprise_origin = "git@github.enterprise.com:owner/repo.git"
-
-    with (
-        changing_dir(configured_app.path),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_remote_origin",
-            return_value=enterprise_origin,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._check_gh_cli_installed",
-            return_value=False,
-        ),
-        patch(
-            "fastapi_cloud_cli.commands.setup_ci._get_default_branch",
-            return_value="main",
-        ),
-        patch.object(FastAPIRichToolkit, "confirm", return_value=True),
-        patch("fastapi_cloud_cli.commands.setup_ci._set_github_secret") as mock_secret,
-    ):
+    with patch.object(FastAPIRichToolkit, "confirm", return_value=True):
         result = runner.invoke(app, ["setup-ci"])
 
     assert result.exit_code == 0
@@ -889,4 +643,4 @@ def test_shows_enterprise_manual_secrets_url_when_gh_not_installed(
     )
     assert "FASTAPI_CLOUD_TOKEN = test-token" in result.output
     assert "github.com/owner/repo" not in result.output
-    mock_secret.assert_not_called()
+    setup_ci_env.set_github_secret.assert_not_called()
@@ -40,6 +40,27 @@ def test_loads_partial_settings(tmp_path: Path) -> None:
     assert settings.client_id == default_settings.client_id
 
 
+def test_get_loads_settings_once_per_config_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    default_settings = Settings.get()
+
+    assert Settings.get() is default_settings
+
+    other_config_dir = tmp_path / "other-config"
+    other_config_dir.mkdir()
+    (other_config_dir / "cli.json").write_text(
+        '{"base_api_url": "https://example.com"}'
+    )
+    monkeypatch.setenv("FASTAPI_CLOUD_CLI_CONFIG_DIR", str(other_config_dir))
+
+    settings = Settings.get()
+
+    assert settings is not default_settings
+    assert settings.base_api_url == "https://example.com"
+    assert default_settings.base_api_url == Settings().base_api_url
+
+
 def test_get_config_folder_reads_env_override(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
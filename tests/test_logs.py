@@ -10,10 +10,30 @@ from typer.testing import CliRunner
 from fastapi_cloud_cli.cli import cloud_app as app
 from fastapi_cloud_cli.utils.api import TooManyRetriesError
 from tests.conftest import ConfiguredApp
-from tests.utils import changing_dir
+from tests.utils import build_logs_response, changing_dir
 
 runner = CliRunner()
 
+_STARTUP_LOG = {
+    "timestamp": "2025-12-05T14:32:01.123000Z",
+    "message": "Application startup complete",
+    "level": "info",
+}
+_HEALTH_LOG = {
+    "timestamp": "2025-12-05T14:32:05.456000Z",
+    "message": "GET /health 200",
+    "level": "info",
+}
+_STARTUP_LOGS = build_logs_response(_STARTUP_LOG)
+_STARTUP_AND_HEALTH_LOGS = build_logs_response(_STARTUP_LOG, _HEALTH_LOG)
+
+
+@pytest.fixture
+def logs_route(
+    respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+) -> respx.Route:
+    return respx_mock.get(f"/apps/{configured_app.app_id}/logs/stream")
+
 
 def test_shows_message_if_not_logged_in(logged_out_cli: None) -> None:
     result = runner.invoke(app, ["logs"])
@@ -31,29 +51,9 @@ def test_shows_message_if_app_not_configured(logged_in_cli: None) -> None:
 
 @pytest.mark.respx
 def test_displays_logs(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
-    log_lines = [
-        json.dumps(
-            {
-                "timestamp": "2025-12-05T14:32:01.123000Z",
-                "message": "Application startup complete",
-                "level": "info",
-            }
-        ),
-        json.dumps(
-            {
-                "timestamp": "2025-12-05T14:32:05.456000Z",
-                "message": "GET /health 200",
-                "level": "info",
-            }
-        ),
-    ]
-    response_content = "\n".join(log_lines)
-
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=_STARTUP_AND_HEALTH_LOGS))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -70,16 +70,8 @@ def test_displays_logs_with_explicit_app_id(
     logged_in_cli: None, respx_mock: respx.MockRouter, tmp_path: Path
 ) -> None:
     app_id = "explicit-app"
-    response_content = json.dumps(
-        {
-            "timestamp": "2025-12-05T14:32:01.123000Z",
-            "message": "Application startup complete",
-            "level": "info",
-        }
-    )
-
-    respx_mock.get(url__regex=rf"/apps/{app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
+    respx_mock.get(f"/apps/{app_id}/logs/stream").mock(
+        return_value=httpx.Response(200, content=_STARTUP_LOGS)
     )
 
     with changing_dir(tmp_path):
@@ -93,19 +85,9 @@ def test_displays_logs_with_explicit_app_id(
 
 @pytest.mark.respx
 def test_apps_logs_displays_logs(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
-    response_content = json.dumps(
-        {
-            "timestamp": "2025-12-05T14:32:01.123000Z",
-            "message": "Application startup complete",
-            "level": "info",
-        }
-    )
-
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=_STARTUP_LOGS))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["apps", "logs", "--no-follow"])
@@ -120,24 +102,10 @@ def test_apps_logs_displays_logs(
 def test_apps_logs_no_follow_json_outputs_envelope(
     logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
 ) -> None:
-    logs = [
-        {
-            "timestamp": "2025-12-05T14:32:01.123000Z",
-            "message": "Application startup complete",
-            "level": "info",
-        },
-        {
-            "timestamp": "2025-12-05T14:32:05.456000Z",
-            "message": "GET /health 200",
-            "level": "info",
-        },
-    ]
-    response_content = "\n".join(json.dumps(log) for log in logs)
-
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"follow": "false"},
-    ).mock(return_value=httpx.Response(200, content=response_content))
+    ).mock(return_value=httpx.Response(200, content=_STARTUP_AND_HEALTH_LOGS))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["apps", "logs", "--no-follow", "--json"])
@@ -146,7 +114,7 @@ def test_apps_logs_no_follow_json_outputs_envelope(
     assert json.loads(result.stdout) == {
         "data": {
             "app_id": configured_app.app_id,
-            "logs": logs,
+            "logs": [_STARTUP_LOG, _HEALTH_LOG],
         }
     }
     assert result.stderr == ""
@@ -156,31 +124,18 @@ def test_apps_logs_no_follow_json_outputs_envelope(
 def test_apps_logs_follow_json_outputs_ndjson(
     logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
 ) -> None:
-    logs = [
-        {
-            "timestamp": "2025-12-05T14:32:01.123000Z",
-            "message": "Application startup complete",
-            "level": "info",
-        },
-        {
-            "timestamp": "2025-12-05T14:32:05.456000Z",
-            "message": "GET /health 200",
-            "level": "info",
-        },
-    ]
-    response_content = "\n".join(json.dumps(log) for log in logs)
-
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"follow": "true"},
-    ).mock(return_value=httpx.Response(200, content=response_content))
+    ).mock(return_value=httpx.Response(200, content=_STARTUP_AND_HEALTH_LOGS))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["apps", "logs", "--json"])
 
     assert result.exit_code == 0
     assert [json.loads(line) for line in result.stdout.splitlines()] == [
-        {"type": "log", "app_id": configured_app.app_id, **log} for log in logs
+        {"type": "log", "app_id": configured_app.app_id, **log}
+        for log in [_STARTUP_LOG, _HEALTH_LOG]
     ]
     assert result.stderr == ""
 
@@ -190,7 +145,7 @@ def test_passes_default_params(
     logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
 ) -> None:
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"follow": "true", "tail": "100", "since": "5m"},
     ).mock(return_value=httpx.Response(200, content=""))
 
@@ -206,18 +161,10 @@ def test_passes_default_params(
 def test_streams_logs_in_human_output(
     logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
 ) -> None:
-    response_content = json.dumps(
-        {
-            "timestamp": "2025-12-05T14:32:01.123000Z",
-            "message": "Application startup complete",
-            "level": "info",
-        }
-    )
-
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"follow": "true"},
-    ).mock(return_value=httpx.Response(200, content=response_content))
+    ).mock(return_value=httpx.Response(200, content=_STARTUP_LOGS))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs"])
@@ -232,7 +179,7 @@ def test_passes_custom_params(
     logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
 ) -> None:
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"tail": "50", "since": "1h", "follow": "false"},
     ).mock(return_value=httpx.Response(200, content=""))
 
@@ -246,7 +193,7 @@ def test_passes_custom_params(
 
 @pytest.mark.respx
 def test_displays_all_log_levels(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
     log_lines = [
         json.dumps(
@@ -280,9 +227,7 @@ def test_displays_all_log_levels(
     ]
     response_content = "\n".join(log_lines)
 
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=response_content))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -295,55 +240,35 @@ def test_displays_all_log_levels(
 
 
 @pytest.mark.respx
-def test_handles_401_unauthorized(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
-) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(401)
-    )
-
-    with changing_dir(configured_app.path):
-        result = runner.invoke(app, ["logs", "--no-follow"])
-
-    assert result.exit_code == 1
-    assert "token is not valid" in result.output
-
-
-@pytest.mark.respx
-def test_handles_403_forbidden(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
-) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(403)
-    )
-
-    with changing_dir(configured_app.path):
-        result = runner.invoke(app, ["logs", "--no-follow"])
-
-    assert result.exit_code == 1
-    assert "You don't have permissions for this resource" in result.output
-
-
-@pytest.mark.respx
-def test_handles_404(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+@pytest.mark.parametrize(
+    ("status_code", "expected_message"),
+    [
+        (401, "token is not valid"),
+        (403, "You don't have permissions for this resource"),
+        (404, "App not found"),
+    ],
+)
+def test_handles_error_status(
+    logged_in_cli: None,
+    logs_route: respx.Route,
+    configured_app: ConfiguredApp,
+    status_code: int,
+    expected_message: str,
 ) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(404)
-    )
+    logs_route.mock(return_value=httpx.Response(status_code))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
 
     assert result.exit_code == 1
-    assert "App not found" in result.output
+    assert expected_message in result.output
 
 
 @pytest.mark.respx
 def test_handles_retention_limit_error(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
+    logs_route.mock(
         return_value=httpx.Response(
             400, json={"detail": "Cannot fetch logs older than 14 days"}
         )
@@ -359,9 +284,9 @@ def test_handles_retention_limit_error(
 
 @pytest.mark.respx
 def test_handles_retention_limit_error_json(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
+    logs_route.mock(
         return_value=httpx.Response(
             400, json={"detail": "Cannot fetch logs older than 14 days"}
         )
@@ -379,11 +304,9 @@ def test_handles_retention_limit_error_json(
 
 @pytest.mark.respx
 def test_shows_message_when_no_logs_found(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content="")
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=""))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -394,16 +317,14 @@ def test_shows_message_when_no_logs_found(
 
 @pytest.mark.respx
 def test_handles_server_error_message(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
     log_lines = [
         json.dumps({"type": "error", "message": "Log storage unavailable"}),
     ]
     response_content = "\n".join(log_lines)
 
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=response_content))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -414,7 +335,7 @@ def test_handles_server_error_message(
 
 @pytest.mark.respx
 def test_handles_unknown_log_level(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
     log_lines = [
         json.dumps(
@@ -427,9 +348,7 @@ def test_handles_unknown_log_level(
     ]
     response_content = "\n".join(log_lines)
 
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=response_content))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -440,7 +359,7 @@ def test_handles_unknown_log_level(
 
 @pytest.mark.respx
 def test_skips_invalid_json_lines(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
     log_lines = [
         "not valid json",
@@ -454,9 +373,7 @@ def test_skips_invalid_json_lines(
     ]
     response_content = "\n".join(log_lines)
 
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=response_content))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -467,7 +384,7 @@ def test_skips_invalid_json_lines(
 
 @pytest.mark.respx
 def test_skips_heartbeat_messages(
-    logged_in_cli: None, respx_mock: respx.MockRouter, configured_app: ConfiguredApp
+    logged_in_cli: None, logs_route: respx.Route, configured_app: ConfiguredApp
 ) -> None:
     log_lines = [
         json.dumps({"type": "heartbeat"}),
@@ -481,9 +398,7 @@ def test_skips_heartbeat_messages(
     ]
     response_content = "\n".join(log_lines)
 
-    respx_mock.get(url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*").mock(
-        return_value=httpx.Response(200, content=response_content)
-    )
+    logs_route.mock(return_value=httpx.Response(200, content=response_content))
 
     with changing_dir(configured_app.path):
         result = runner.invoke(app, ["logs", "--no-follow"])
@@ -571,7 +486,7 @@ def test_accepts_valid_since_format(
     valid_since: str,
 ) -> None:
     respx_mock.get(
-        url__regex=rf"/apps/{configured_app.app_id}/logs/stream.*",
+        f"/apps/{configured_app.app_id}/logs/stream",
         params={"since": valid_since},
     ).mock(return_value=httpx.Response(200, content=""))
 
@@ -44,19 +44,19 @@ else:
         BACKSPACE = "\x7f"
 
 
-def create_jwt_token(payload: dict[str, Any]) -> str:
-    # Note: This creates a JWT with an invalid signature, but that's OK for our tests
-    # since we only parse the payload, not verify the signature.
+# Note: These tokens have an invalid signature, but that's OK for our tests
+# since we only parse the payload, not verify the signature.
+_JWT_HEADER_ENCODED = (
+    base64.urlsafe_b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    .decode()
+    .rstrip("=")
+)
+_JWT_SIGNATURE_ENCODED = base64.urlsafe_b64encode(b"signature").decode().rstrip("=")
 
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_encoded = (
-        base64.urlsafe_b64encode(json.dumps(header).encode()).decode().rstrip("=")
-    )
 
+def create_jwt_token(payload: dict[str, Any]) -> str:
     payload_encoded = (
         base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
     )
 
-    signature = base64.urlsafe_b64encode(b"signature").decode().rstrip("=")
-
-    return f"{header_encoded}.{payload_encoded}.{signature}"
+    return f"{_JWT_HEADER_ENCODED}.{payload_encoded}.{_JWT_SIGNATURE_ENCODED}"